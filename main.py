@@ -4,11 +4,11 @@ import uuid
 import sys
 import re
 from openai import OpenAI
-from neo4j import GraphDatabase, basic_auth
+from neo4j import GraphDatabase, basic_auth, READ_ACCESS
 from datetime import datetime
 import warnings
 import gradio as gr 
-from utils import send_to_neo4j, chat_with_kg
+from utils import send_to_neo4j, chat_with_kg, BOOKMARK_MANAGER
 from pyvis.network import Network
 import tempfile
 import html as _html
@@ -95,21 +95,28 @@ def graph_snapshot():
     """
     net = Network(height="600px", width="100%", notebook=False)
     
-    driver = GraphDatabase.driver(
+    def _fetch_snapshot(tx):
+        result = tx.run("MATCH (n)-[r]->(m) RETURN n, r, m LIMIT 100")
+        return list(result)
+
+    with GraphDatabase.driver(
         NEO4J_URI,
         auth=basic_auth(NEO4J_USERNAME, NEO4J_PASSWORD)
-    )
-    with driver.session(database=NEO4J_DATABASE) as session:
-        result = session.run(
-            "MATCH (n)-[r]->(m) RETURN n, r, m LIMIT 100"
-        )
-        for record in result:
-            n = record["n"]
-            m = record["m"]
-            r = record["r"]
-            net.add_node(n.id, label=":".join(n.labels), title=str(dict(n)))
-            net.add_node(m.id, label=":".join(m.labels), title=str(dict(m)))
-            net.add_edge(n.id, m.id, label=r.type)
+    ) as driver:
+        with driver.session(
+            database=NEO4J_DATABASE,
+            default_access_mode=READ_ACCESS,
+            bookmark_manager=BOOKMARK_MANAGER,
+        ) as session:
+            records = session.execute_read(_fetch_snapshot)
+
+    for record in records:
+        n = record["n"]
+        m = record["m"]
+        r = record["r"]
+        net.add_node(n.id, label=":".join(n.labels), title=str(dict(n)))
+        net.add_node(m.id, label=":".join(m.labels), title=str(dict(m)))
+        net.add_edge(n.id, m.id, label=r.type)
     
     tmp = tempfile.NamedTemporaryFile(suffix=".html", delete=False)
     net.write_html(tmp.name, open_browser=False, notebook=False)
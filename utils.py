@@ -5,7 +5,7 @@ import sys
 from dotenv import load_dotenv
 import openai
 from openai import OpenAI
-from neo4j import GraphDatabase, basic_auth 
+from neo4j import GraphDatabase, basic_auth, READ_ACCESS
 from datetime import datetime
 import warnings 
 
@@ -25,6 +25,10 @@ NEO4J_USERNAME = os.getenv("NEO4J_USERNAME")
 NEO4J_PASSWORD = os.getenv("NEO4J_PASSWORD")
 NEO4J_DATABASE = os.getenv("NEO4J_DATABASE")
 
+# Shared across every driver we open so reads issued after an upload
+# wait for that write on whichever cluster member they are routed to.
+BOOKMARK_MANAGER = GraphDatabase.bookmark_manager()
+
 def extract_medical_data_from_text(text_prompt: str) -> dict | None:
     """
     Uses GPT-4o-mini to extract structured medical data from text based on a predefined schema.
@@ -204,7 +208,7 @@ def execute_neo4j_query(query: str, parameters: dict) -> str | None:
         driver.verify_connectivity()
         print(f"Successfully connected to Neo4j at {NEO4J_URI} (database: '{NEO4J_DATABASE}').")
 
-        with driver.session(database=NEO4J_DATABASE) as session:
+        with driver.session(database=NEO4J_DATABASE, bookmark_manager=BOOKMARK_MANAGER) as session:
             result = session.run(query, parameters)
             record = result.single()
             if record and "patientId" in record:
@@ -352,8 +356,18 @@ You are an expert translator of natural language questions into Neo4j Cypher que
         print(f"Error during Cypher generation with LLM: {e}")
         return None
 
+def _collect_records(tx, query: str) -> list[dict]:
+    """Runs a query inside a managed transaction and materialises its records."""
+    result = tx.run(query)
+    return [record.data() for record in result]
+
 def run_read_query(query: str) -> list[dict] | None:
-    """Executes a read-only Cypher query against Neo4j and returns results."""
+    """
+    Executes a read-only Cypher query against Neo4j and returns results.
+
+    Runs as a read-mode managed transaction so `neo4j://` routing can serve it
+    from a follower or read replica, retrying on routing/transient errors.
+    """
     if not NEO4J_PASSWORD:
         print("CRITICAL Error in run_read_query: NEO4J_PASSWORD not set.")
         return None
@@ -362,9 +376,12 @@ def run_read_query(query: str) -> list[dict] | None:
         auth = basic_auth(NEO4J_USERNAME, NEO4J_PASSWORD)
         driver = GraphDatabase.driver(NEO4J_URI, auth=auth)
         driver.verify_connectivity()
-        with driver.session(database=NEO4J_DATABASE) as session:
-            result = session.run(query)
-            results_list = [record.data() for record in result]
+        with driver.session(
+            database=NEO4J_DATABASE,
+            default_access_mode=READ_ACCESS,
+            bookmark_manager=BOOKMARK_MANAGER,
+        ) as session:
+            results_list = session.execute_read(_collect_records, query)
             print(f"Debug: Query returned {len(results_list)} record(s).")
             return results_list
     except Exception as e: